@@ -2,7 +2,7 @@
 AstroEngine API - Configurações e Variáveis de Ambiente
 """
 import os
-from functools import lru_cache
+from functools import cached_property
 
 
 class Settings:
@@ -13,9 +13,9 @@ class Settings:
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
     # Segurança
-    API_KEYS: list[str] = [
+    API_KEYS: frozenset[str] = frozenset(
         k.strip() for k in os.getenv("API_KEYS", "dev-key-cosmic-suite").split(",")
-    ]
+    )
     ALLOWED_ORIGINS: list[str] = [
         o.strip() for o in os.getenv("ALLOWED_ORIGINS", "*").split(",")
     ]
@@ -37,6 +37,10 @@ class Settings:
     )
 
     @property
+    def cors_allow_all(self) -> bool:
+        return "*" in self.ALLOWED_ORIGINS
+
+    @cached_property
     def orbs(self) -> dict[str, float]:
         return {
             "conjunction": self.DEFAULT_ORB_CONJUNCTION,
@@ -47,6 +51,8 @@ class Settings:
         }
 
 
-@lru_cache()
+SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    return Settings()
+    return SETTINGS
@@ -7,15 +7,26 @@ Licenciado sob GNU Affero General Public License v3.0 (AGPL-3.0).
 Copyright (C) 2026 FW2B - Frameworks to Business
 Código-fonte: https://github.com/FW2B/astroengine-api
 """
+import asyncio
+import atexit
+import copy
 import logging
-import json
+import os
+import queue
+import sys
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
 from app.middleware.rate_limit import RateLimitMiddleware
+from app.models.schemas import BirthData
+from app.services.astronomy_calc import calculate_natal_chart
 from app.routers import natal, synastry, transits, composite, planets, numerology
 
 # --- Logging Estruturado ---
@@ -24,20 +35,93 @@ settings = get_settings()
 
 class JSONFormatter(logging.Formatter):
     def format(self, record):
+        # serialize() já inclui a quebra de linha final para escrita direta
+        return self.serialize(record)[:-1].decode()
+
+    def serialize(self, record) -> bytes:
         log_data = {
-            "timestamp": self.formatTime(record),
+            # O orjson serializa o datetime em C; isso sai mais barato que
+            # montar a string em Python, mesmo reaproveitando o strftime por segundo.
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_data["exception"] = record.exc_text
+        return orjson.dumps(log_data, option=orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE)
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Enfileira os registros para serem formatados e escritos pelo QueueListener
+    em uma thread separada, fora do event loop.
+    """
+
+    def prepare(self, record):
+        # Interpola a mensagem e serializa a exceção aqui, pois args e
+        # exc_info podem não ser seguros para consumir em outra thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_data)
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
 
-handler = logging.StreamHandler()
-handler.setFormatter(JSONFormatter())
-logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL), handlers=[handler])
+class JSONFileDescriptorHandler(logging.Handler):
+    """
+    Escreve os bytes gerados pelo JSONFormatter diretamente no descritor de
+    arquivo do stderr, sem passar pela decodificação e recodificação de texto
+    do StreamHandler.
+
+    O descritor é obtido a cada emissão, e não na importação: se o stderr
+    atual não tiver um (pytest com --capture=sys, stderr redirecionado para
+    um StringIO), os bytes vão para o buffer binário do stream ou, na falta
+    dele, para o próprio stream como texto.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.formatter = JSONFormatter()
+
+    def emit(self, record):
+        try:
+            data = self.formatter.serialize(record)
+            stream = sys.stderr
+            try:
+                fd = stream.fileno()
+            except (AttributeError, OSError, ValueError):
+                buffer = getattr(stream, "buffer", None)
+                if buffer is not None:
+                    stream.flush()
+                    buffer.write(data)
+                    buffer.flush()
+                else:
+                    stream.write(data.decode())
+                    stream.flush()
+                return
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        except Exception:
+            self.handleError(record)
+
+
+handler = JSONFileDescriptorHandler()
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, handler)
+# O listener sobe junto com o handler da fila, e não no lifespan: sem lifespan
+# (TestClient fora de `with`, uvicorn --lifespan off) os registros ficariam
+# acumulados na fila sem nunca serem escritos.
+log_listener.start()
+atexit.register(log_listener.stop)
+logging.basicConfig(
+    level=getattr(logging, settings.LOG_LEVEL), handlers=[LogQueueHandler(log_queue)]
+)
 logger = logging.getLogger("astroengine")
 
 
@@ -45,8 +129,30 @@ logger = logging.getLogger("astroengine")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("AstroEngine API iniciando...")
-    logger.info(f"Sistema de casas padrão: {settings.DEFAULT_HOUSE_SYSTEM}")
-    logger.info(f"Rate limit: {settings.RATE_LIMIT_PER_MINUTE} req/min")
+    logger.info("Sistema de casas padrão: %s", settings.DEFAULT_HOUSE_SYSTEM)
+    logger.info("Rate limit: %s req/min", settings.RATE_LIMIT_PER_MINUTE)
+    # Aquecer a Swiss Ephemeris e os validadores Pydantic com um mapa de
+    # referência. A pyswisseph guarda estado por thread, então o aquecimento
+    # roda na thread do event loop (usada por /natal_chart) e também em uma
+    # thread do executor padrão (usada pelos endpoints com asyncio.to_thread).
+    # Threads do executor criadas depois ainda pagam a própria primeira chamada.
+    calculate_natal_chart(
+        BirthData(
+            name="warmup",
+            birth_datetime_utc="2000-01-01T12:00:00Z",
+            latitude=0.0,
+            longitude=0.0,
+        )
+    )
+    await asyncio.to_thread(
+        calculate_natal_chart,
+        BirthData(
+            name="warmup",
+            birth_datetime_utc="2000-01-02T12:00:00Z",
+            latitude=0.0,
+            longitude=0.0,
+        ),
+    )
     yield
     logger.info("AstroEngine API encerrando...")
 
@@ -66,10 +172,14 @@ app = FastAPI(
 )
 
 # --- Middlewares ---
+# Com "*" qualquer origem é aceita e o navegador não admite credenciais com o
+# curinga, então o CORSMiddleware responde com o cabeçalho estático em vez de
+# comparar e ecoar a origem a cada requisição.
+cors_allow_all = settings.cors_allow_all
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
-    allow_credentials=True,
+    allow_origins=["*"] if cors_allow_all else settings.ALLOWED_ORIGINS,
+    allow_credentials=not cors_allow_all,
     allow_methods=["*"],
     allow_headers=["*"],
 )
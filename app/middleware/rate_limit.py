@@ -6,42 +6,70 @@ considerar usar Redis como backend.
 """
 import time
 import logging
-from collections import defaultdict
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+from collections import defaultdict, deque
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import get_settings
 
 logger = logging.getLogger("astroengine")
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Middleware de rate limiting baseado em chave de API ou IP."""
+class RateLimitMiddleware:
+    """Middleware ASGI de rate limiting baseado em chave de API ou IP."""
 
-    def __init__(self, app):
-        super().__init__(app)
-        self.requests: dict[str, list[float]] = defaultdict(list)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.requests: dict[str, deque[float]] = defaultdict(deque)
         settings = get_settings()
         self.limit = settings.RATE_LIMIT_PER_MINUTE
         self.window = 60  # 1 minuto
+        self._last_sweep = time.time()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
         # Identificar o cliente pela API key ou IP
-        client_id = request.headers.get("X-API-Key") or request.client.host
+        client_id = _client_id(scope)
         now = time.time()
+        if now - self._last_sweep > self.window:
+            self._sweep(now)
 
-        # Limpar requisições antigas
-        self.requests[client_id] = [
-            t for t in self.requests[client_id] if now - t < self.window
-        ]
+        # Limpar requisições antigas (timestamps ficam em ordem crescente)
+        timestamps = self.requests[client_id]
+        cutoff = now - self.window
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
 
-        if len(self.requests[client_id]) >= self.limit:
-            logger.warning(f"Rate limit excedido para {client_id}")
-            raise HTTPException(
+        if len(timestamps) >= self.limit:
+            logger.warning("Rate limit excedido para %s", client_id)
+            response = JSONResponse(
                 status_code=429,
-                detail=f"Rate limit exceeded. Maximum {self.limit} requests per minute.",
+                content={
+                    "detail": f"Rate limit exceeded. Maximum {self.limit} requests per minute."
+                },
             )
+            await response(scope, receive, send)
+            return
+
+        timestamps.append(now)
+        await self.app(scope, receive, send)
+
+    def _sweep(self, now: float) -> None:
+        """Remove clientes sem requisições dentro da janela atual."""
+        cutoff = now - self.window
+        for client_id, timestamps in list(self.requests.items()):
+            if not timestamps or timestamps[-1] <= cutoff:
+                del self.requests[client_id]
+        self._last_sweep = now
+
 
-        self.requests[client_id].append(now)
-        response = await call_next(request)
-        return response
+def _client_id(scope: Scope) -> str:
+    """Extrai a chave de API dos headers crus do ASGI ou, na falta dela, o IP."""
+    for name, value in scope["headers"]:
+        if name == b"x-api-key" and value:
+            return value.decode("latin-1")
+    client = scope.get("client")
+    return client[0] if client else ""
@@ -17,14 +17,14 @@ class HouseSystem(str, Enum):
 
 
 # Mapeamento de HouseSystem para código Swiss Ephemeris
-HOUSE_SYSTEM_CODES: dict[str, bytes] = {
-    "placidus": b"P",
-    "koch": b"K",
-    "porphyrius": b"O",
-    "regiomontanus": b"R",
-    "campanus": b"C",
-    "equal": b"E",
-    "whole_sign": b"W",
+HOUSE_SYSTEM_CODES: dict[HouseSystem, bytes] = {
+    HouseSystem.PLACIDUS: b"P",
+    HouseSystem.KOCH: b"K",
+    HouseSystem.PORPHYRIUS: b"O",
+    HouseSystem.REGIOMONTANUS: b"R",
+    HouseSystem.CAMPANUS: b"C",
+    HouseSystem.EQUAL: b"E",
+    HouseSystem.WHOLE_SIGN: b"W",
 }
 
 
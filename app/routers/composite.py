@@ -1,6 +1,7 @@
 """
 AstroEngine API - Endpoint /composite
 """
+import asyncio
 import logging
 from fastapi import APIRouter, Depends
 
@@ -14,10 +15,10 @@ from app.services.astronomy_calc import (
     calculate_natal_chart,
     calculate_composite_midpoint,
 )
-from app.services.zodiac import longitude_to_sign
+from app.services.zodiac import longitudes_to_signs, determine_houses
 from app.services.aspects import calculate_aspects
 from app.middleware.auth import verify_api_key
-from app.config import get_settings
+from app.config import SETTINGS
 
 logger = logging.getLogger("astroengine")
 router = APIRouter()
@@ -37,33 +38,43 @@ async def composite(
     api_key: str = Depends(verify_api_key),
 ) -> CompositeChart:
     logger.info(
-        f"Calculando mapa composto entre: {data.person1.name} e {data.person2.name}"
+        "Calculando mapa composto entre: %s e %s",
+        data.person1.name, data.person2.name,
     )
 
-    chart1 = calculate_natal_chart(data.person1)
-    chart2 = calculate_natal_chart(data.person2)
-
-    # Calcular pontos médios dos planetas
-    composite_planets: list[PlanetPosition] = []
-    for p1 in chart1.planets:
-        # Encontrar o planeta correspondente no chart2
-        p2 = next((p for p in chart2.planets if p.planet == p1.planet), None)
-        if p2 is None:
-            continue
-
-        midpoint = calculate_composite_midpoint(p1.absolute_degree, p2.absolute_degree)
-        sign, degree = longitude_to_sign(midpoint)
+    chart1, chart2 = await asyncio.gather(
+        asyncio.to_thread(calculate_natal_chart, data.person1),
+        asyncio.to_thread(calculate_natal_chart, data.person2),
+    )
 
-        composite_planets.append(
-            PlanetPosition(
-                planet=p1.planet,
-                sign=sign,
-                degree=round(degree, 4),
-                absolute_degree=round(midpoint, 4),
-                house=0,  # Casas serão recalculadas abaixo
-                retrograde=False,
-            )
+    # Calcular pontos médios dos planetas. Os modelos intermediários são
+    # montados com model_construct, sem validação, pois os valores acabaram de
+    # ser calculados aqui. O construtor do CompositeChart não revalida modelos
+    # já instanciados; só a serialização pelo response_model confere a saída.
+    chart2_by_name = {p.planet: p for p in chart2.planets}
+    # Parear cada planeta com o correspondente no chart2
+    pairs = [
+        (p1, chart2_by_name[p1.planet])
+        for p1 in chart1.planets
+        if p1.planet in chart2_by_name
+    ]
+    midpoints = [
+        calculate_composite_midpoint(p1.absolute_degree, p2.absolute_degree)
+        for p1, p2 in pairs
+    ]
+    composite_planets: list[PlanetPosition] = [
+        PlanetPosition.model_construct(
+            planet=p1.planet,
+            sign=sign,
+            degree=degree,
+            absolute_degree=round(midpoint, 4),
+            house=0,  # Casas serão recalculadas abaixo
+            retrograde=False,
+        )
+        for (p1, _), midpoint, (sign, degree) in zip(
+            pairs, midpoints, longitudes_to_signs(midpoints)
         )
+    ]
 
     # Calcular pontos médios do Ascendente e MC para as casas compostas
     asc_midpoint = calculate_composite_midpoint(
@@ -74,32 +85,36 @@ async def composite(
     )
 
     # Gerar casas compostas usando Equal House a partir do ASC composto
-    composite_houses: list[HouseCusp] = []
-    for i in range(12):
-        cusp_lon = (asc_midpoint + i * 30) % 360
-        sign, degree = longitude_to_sign(cusp_lon)
-        composite_houses.append(
-            HouseCusp(
-                house=i + 1,
-                sign=sign,
-                degree=round(degree, 4),
-                absolute_degree=round(cusp_lon, 4),
-            )
+    # asc_midpoint já está em [0, 360), então cada cúspide passa de 360 no
+    # máximo uma vez e uma subtração substitui o módulo.
+    cusp_lons = [asc_midpoint + i * 30 for i in range(12)]
+    cusp_lons = [lon - 360 if lon >= 360 else lon for lon in cusp_lons]
+    composite_houses: list[HouseCusp] = [
+        HouseCusp.model_construct(
+            house=i + 1,
+            sign=sign,
+            degree=degree,
+            absolute_degree=round(cusp_lon, 4),
         )
+        for i, (cusp_lon, (sign, degree)) in enumerate(
+            zip(cusp_lons, longitudes_to_signs(cusp_lons))
+        )
+    ]
 
     # Atribuir casas aos planetas compostos
     raw_cusps = [h.absolute_degree for h in composite_houses]
-    from app.services.zodiac import determine_house
-
-    for planet in composite_planets:
-        planet.house = determine_house(planet.absolute_degree, raw_cusps)
+    planet_houses = determine_houses(
+        [planet.absolute_degree for planet in composite_planets], raw_cusps
+    )
+    for planet, house in zip(composite_planets, planet_houses):
+        planet.house = house
 
     # Calcular aspectos do mapa composto
-    settings = get_settings()
-    composite_aspects = calculate_aspects(composite_planets, orbs=settings.orbs)
+    composite_aspects = calculate_aspects(composite_planets, orbs=SETTINGS.orbs)
 
     logger.info(
-        f"Mapa composto calculado: {len(composite_aspects)} aspectos encontrados"
+        "Mapa composto calculado: %s aspectos encontrados",
+        len(composite_aspects),
     )
 
     return CompositeChart(
@@ -26,7 +26,7 @@ async def natal_chart(
     birth_data: BirthData,
     api_key: str = Depends(verify_api_key),
 ) -> NatalChart:
-    logger.info(f"Calculando mapa natal para: {birth_data.name}")
+    logger.info("Calculando mapa natal para: %s", birth_data.name)
     chart = calculate_natal_chart(birth_data)
-    logger.info(f"Mapa natal calculado com sucesso para: {birth_data.name}")
+    logger.info("Mapa natal calculado com sucesso para: %s", birth_data.name)
     return chart
@@ -32,7 +32,7 @@ async def numerology_profile(
     data: NumerologyInput,
     api_key: str = Depends(verify_api_key),
 ) -> dict:
-    logger.info(f"Calculando perfil numerológico para: {data.full_name}")
+    logger.info("Calculando perfil numerológico para: %s", data.full_name)
 
     profile = calculate_full_profile(
         full_name=data.full_name,
@@ -44,13 +44,11 @@ async def numerology_profile(
         current_day=data.current_day,
     )
 
-    # Adaptar a estrutura de pinnacles e challenges para o schema
-    profile["life_cycles"] = {
-        "pinnacles": profile["life_cycles"]["pinnacles"]["pinnacles"],
-        "challenges": profile["life_cycles"]["challenges"]["challenges"],
-    }
+    # Adaptar a estrutura de pinnacles e challenges para o schema, sem alterar
+    # o perfil memoizado devolvido pelo serviço
+    profile = {**profile, "life_cycles": _flatten_life_cycles(profile)}
 
-    logger.info(f"Perfil numerológico calculado para: {data.full_name}")
+    logger.info("Perfil numerológico calculado para: %s", data.full_name)
     return profile
 
 
@@ -69,7 +67,8 @@ async def numerology_compatibility(
     api_key: str = Depends(verify_api_key),
 ) -> dict:
     logger.info(
-        f"Calculando compatibilidade numerológica: {data.person1_name} x {data.person2_name}"
+        "Calculando compatibilidade numerológica: %s x %s",
+        data.person1_name, data.person2_name,
     )
 
     result = calculate_compatibility(
@@ -86,12 +85,18 @@ async def numerology_compatibility(
     # Adaptar a estrutura de pinnacles e challenges para ambos os perfis
     for profile_key in ["profile1", "profile2"]:
         profile = result[profile_key]
-        profile["life_cycles"] = {
-            "pinnacles": profile["life_cycles"]["pinnacles"]["pinnacles"],
-            "challenges": profile["life_cycles"]["challenges"]["challenges"],
-        }
+        result[profile_key] = {**profile, "life_cycles": _flatten_life_cycles(profile)}
 
     logger.info(
-        f"Compatibilidade numerológica calculada: {data.person1_name} x {data.person2_name}"
+        "Compatibilidade numerológica calculada: %s x %s",
+        data.person1_name, data.person2_name,
     )
     return result
+
+
+def _flatten_life_cycles(profile: dict) -> dict:
+    """Extrai as listas de pinnacles e challenges no formato do schema."""
+    return {
+        "pinnacles": profile["life_cycles"]["pinnacles"]["pinnacles"],
+        "challenges": profile["life_cycles"]["challenges"]["challenges"],
+    }
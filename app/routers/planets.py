@@ -1,7 +1,9 @@
 """
 AstroEngine API - Endpoint /planets/now
 """
+import asyncio
 import logging
+import time
 from fastapi import APIRouter, Depends
 
 from app.models.schemas import PlanetPosition
@@ -11,18 +13,34 @@ from app.middleware.auth import verify_api_key
 logger = logging.getLogger("astroengine")
 router = APIRouter()
 
+# As posições mudam pouco dentro de um minuto, então todos os clientes
+# (dashboards e widgets) compartilham um único cálculo por janela.
+CACHE_TTL_SECONDS = 60
+
+_now_cache: tuple[int, list[PlanetPosition]] = (-1, [])
+_now_lock = asyncio.Lock()
+
 
 @router.get(
     "/planets/now",
     response_model=list[PlanetPosition],
     summary="Retorna as posições planetárias atuais",
     description=(
-        "Retorna as posições planetárias atuais, útil para dashboards e widgets."
+        "Retorna as posições planetárias atuais, útil para dashboards e widgets. "
+        f"O resultado é recalculado no máximo uma vez a cada {CACHE_TTL_SECONDS} segundos."
     ),
 )
 async def planets_now(
     api_key: str = Depends(verify_api_key),
 ) -> list[PlanetPosition]:
-    logger.info("Calculando posições planetárias atuais")
-    positions = calculate_current_positions()
-    return positions
+    global _now_cache
+
+    bucket = int(time.time() // CACHE_TTL_SECONDS)
+    if _now_cache[0] != bucket:
+        async with _now_lock:
+            # Outra requisição pode ter preenchido o cache enquanto esta esperava
+            if _now_cache[0] != bucket:
+                logger.info("Calculando posições planetárias atuais")
+                positions = await asyncio.to_thread(calculate_current_positions)
+                _now_cache = (bucket, positions)
+    return _now_cache[1]
@@ -1,6 +1,7 @@
 """
 AstroEngine API - Endpoint /synastry
 """
+import asyncio
 import logging
 from fastapi import APIRouter, Depends
 
@@ -8,7 +9,7 @@ from app.models.schemas import SynastryInput, SynastryReport
 from app.services.astronomy_calc import calculate_natal_chart
 from app.services.aspects import calculate_aspects
 from app.middleware.auth import verify_api_key
-from app.config import get_settings
+from app.config import SETTINGS
 
 logger = logging.getLogger("astroengine")
 router = APIRouter()
@@ -28,20 +29,23 @@ async def synastry(
     api_key: str = Depends(verify_api_key),
 ) -> SynastryReport:
     logger.info(
-        f"Calculando sinastria entre: {data.person1.name} e {data.person2.name}"
+        "Calculando sinastria entre: %s e %s",
+        data.person1.name, data.person2.name,
     )
 
-    chart1 = calculate_natal_chart(data.person1)
-    chart2 = calculate_natal_chart(data.person2)
+    chart1, chart2 = await asyncio.gather(
+        asyncio.to_thread(calculate_natal_chart, data.person1),
+        asyncio.to_thread(calculate_natal_chart, data.person2),
+    )
 
     # Calcular aspectos inter-cartas
-    settings = get_settings()
     synastry_aspects = calculate_aspects(
-        chart1.planets, chart2.planets, orbs=settings.orbs
+        chart1.planets, chart2.planets, orbs=SETTINGS.orbs
     )
 
     logger.info(
-        f"Sinastria calculada: {len(synastry_aspects)} aspectos encontrados"
+        "Sinastria calculada: %s aspectos encontrados",
+        len(synastry_aspects),
     )
 
     return SynastryReport(
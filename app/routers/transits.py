@@ -1,6 +1,7 @@
 """
 AstroEngine API - Endpoint /transits
 """
+import asyncio
 import logging
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends
@@ -14,7 +15,7 @@ from app.services.astronomy_calc import (
 )
 from app.services.aspects import calculate_aspects
 from app.middleware.auth import verify_api_key
-from app.config import get_settings
+from app.config import SETTINGS
 
 logger = logging.getLogger("astroengine")
 router = APIRouter()
@@ -33,10 +34,7 @@ async def transits(
     data: TransitInput,
     api_key: str = Depends(verify_api_key),
 ) -> TransitReport:
-    logger.info(f"Calculando trânsitos para: {data.birth_data.name}")
-
-    # Calcular mapa natal
-    natal_chart = calculate_natal_chart(data.birth_data)
+    logger.info("Calculando trânsitos para: %s", data.birth_data.name)
 
     # Determinar data do trânsito
     if data.transit_datetime_utc:
@@ -44,20 +42,23 @@ async def transits(
         transit_dt_str = data.transit_datetime_utc
     else:
         transit_dt = datetime.now(timezone.utc)
-        transit_dt_str = transit_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        transit_dt_str = transit_dt.replace(microsecond=0, tzinfo=None).isoformat() + "Z"
 
-    # Calcular posições dos planetas em trânsito
+    # Calcular o mapa natal e as posições dos planetas em trânsito
     transit_jd = _datetime_to_jd(transit_dt)
-    transit_planets = calculate_planet_positions(transit_jd)
+    natal_chart, transit_planets = await asyncio.gather(
+        asyncio.to_thread(calculate_natal_chart, data.birth_data),
+        asyncio.to_thread(calculate_planet_positions, transit_jd),
+    )
 
     # Calcular aspectos entre trânsitos e natal
-    settings = get_settings()
     transit_aspects = calculate_aspects(
-        transit_planets, natal_chart.planets, orbs=settings.orbs
+        transit_planets, natal_chart.planets, orbs=SETTINGS.orbs
     )
 
     logger.info(
-        f"Trânsitos calculados: {len(transit_aspects)} aspectos encontrados"
+        "Trânsitos calculados: %s aspectos encontrados",
+        len(transit_aspects),
     )
 
     return TransitReport(
@@ -1,10 +1,15 @@
 """
 AstroEngine API - Cálculo de aspectos entre planetas
 """
+from functools import lru_cache
+
+from pydantic import TypeAdapter
+
 from app.models.schemas import Aspect, PlanetPosition
-from app.config import get_settings
+from app.config import SETTINGS
 
-# Definição dos aspectos e seus ângulos exatos
+# Definição dos aspectos e seus ângulos exatos. Com orbes largos mais de um
+# aspecto pode caber na mesma distância; vale o primeiro nesta ordem.
 ASPECT_ANGLES: dict[str, float] = {
     "conjunction": 0.0,
     "sextile": 60.0,
@@ -13,11 +18,36 @@ ASPECT_ANGLES: dict[str, float] = {
     "opposition": 180.0,
 }
 
+_ASPECT_NAMES: tuple[str, ...] = tuple(ASPECT_ANGLES)
+_ASPECT_ANGLE_ARR: tuple[float, ...] = tuple(ASPECT_ANGLES.values())
+
+# Valida a lista inteira de aspectos em uma única chamada ao pydantic-core
+_ASPECT_LIST_ADAPTER = TypeAdapter(list[Aspect])
+
+
+@lru_cache(maxsize=32)
+def _aspect_lookup(
+    orb_arr: tuple[float, ...],
+) -> tuple[tuple[tuple[int, float, float], ...], ...]:
+    """
+    Tabela de 181 entradas indexada por int(distância). Cada entrada lista,
+    na ordem de ASPECT_ANGLES, os aspectos (índice, ângulo, orbe) cujo orbe
+    alcança o intervalo [d, d+1); vazia se nenhum alcança.
+    """
+    return tuple(
+        tuple(
+            (k, angle, orb)
+            for k, (angle, orb) in enumerate(zip(_ASPECT_ANGLE_ARR, orb_arr))
+            if angle - orb < d + 1 and d <= angle + orb
+        )
+        for d in range(181)
+    )
+
 
 def angular_distance(lon1: float, lon2: float) -> float:
     """Calcula a menor distância angular entre duas longitudes eclípticas."""
-    diff = abs(lon1 - lon2) % 360
-    return min(diff, 360 - diff)
+    diff = abs(lon1 - lon2) % 360.0
+    return 180.0 - abs(diff - 180.0)
 
 
 def calculate_aspects(
@@ -32,54 +62,61 @@ def calculate_aspects(
     Se planets2 é fornecido, calcula aspectos inter-cartas (sinastria/trânsitos).
     """
     if orbs is None:
-        settings = get_settings()
-        orbs = settings.orbs
+        orbs = SETTINGS.orbs
+
+    # Resolver os orbes uma única vez, alinhados com a ordem de ASPECT_ANGLES
+    orb_arr = tuple(orbs.get(name, 8.0) for name in _ASPECT_NAMES)
+    lookup = _aspect_lookup(orb_arr)
 
-    aspects: list[Aspect] = []
+    # Aspectos encontrados, como dicts crus para validação em lote no final
+    found: list[dict] = []
     is_natal = planets2 is None
 
     if is_natal:
         planets2 = planets1
 
-    for i, p1 in enumerate(planets1):
-        start_j = i + 1 if is_natal else 0
-        for j in range(start_j, len(planets2)):
-            p2 = planets2[j]
-            if is_natal and p1.planet == p2.planet:
+    # Extrair de uma só vez os campos usados no laço, evitando acessar
+    # atributos dos modelos Pydantic a cada par de planetas
+    rows1 = [(p.planet, p.absolute_degree, p.retrograde) for p in planets1]
+    rows2 = rows1 if is_natal else [
+        (p.planet, p.absolute_degree, p.retrograde) for p in planets2
+    ]
+
+    for i, (name1, lon1, retro1) in enumerate(rows1):
+        for name2, lon2, retro2 in (rows2[i + 1:] if is_natal else rows2):
+            if is_natal and name1 == name2:
                 continue
 
-            dist = angular_distance(p1.absolute_degree, p2.absolute_degree)
+            dist = angular_distance(lon1, lon2)
 
-            for aspect_name, exact_angle in ASPECT_ANGLES.items():
-                max_orb = orbs.get(aspect_name, 8.0)
+            # Um par de planetas só forma um aspecto principal: o primeiro,
+            # na ordem de ASPECT_ANGLES, cujo orbe contém a distância. A
+            # tabela restringe a busca aos aspectos que alcançam aquele grau.
+            for k, exact_angle, max_orb in lookup[int(dist)]:
                 orb_value = abs(dist - exact_angle)
-
                 if orb_value <= max_orb:
-                    # Determinar se o aspecto é aplicativo ou separativo
-                    # Aplicativo: os planetas estão se aproximando do aspecto exato
-                    # Separativo: os planetas estão se afastando
-                    applying = _is_applying(
-                        p1.absolute_degree, p2.absolute_degree,
-                        p1.retrograde, p2.retrograde,
-                        exact_angle,
-                    )
-
-                    aspects.append(
-                        Aspect(
-                            planet1=p1.planet,
-                            planet2=p2.planet,
-                            aspect_type=aspect_name,
-                            orb=round(orb_value, 4),
-                            applying=applying,
-                        )
-                    )
-                    break  # Um par de planetas só forma um aspecto principal
-
-    return aspects
+                    break
+            else:
+                continue
+
+            # Determinar se o aspecto é aplicativo ou separativo
+            # Aplicativo: os planetas estão se aproximando do aspecto exato
+            # Separativo: os planetas estão se afastando
+            applying = _is_applying(dist, retro1, retro2, exact_angle)
+
+            found.append({
+                "planet1": name1,
+                "planet2": name2,
+                "aspect_type": _ASPECT_NAMES[k],
+                "orb": round(orb_value, 4),
+                "applying": applying,
+            })
+
+    return _ASPECT_LIST_ADAPTER.validate_python(found)
 
 
 def _is_applying(
-    lon1: float, lon2: float,
+    current_dist: float,
     retro1: bool, retro2: bool,
     exact_angle: float,
 ) -> bool:
@@ -89,14 +126,11 @@ def _is_applying(
     Lógica simplificada: se o planeta mais rápido (geralmente o primeiro em ordem
     de velocidade) está se movendo em direção ao aspecto exato, é aplicativo.
     Para uma implementação mais precisa, seria necessário comparar velocidades reais.
-    """
-    diff = (lon1 - lon2) % 360
-    if diff > 180:
-        diff -= 360
 
+    Recebe a distância angular já calculada pelo chamador.
+    """
     # Se nenhum está retrógrado, o aspecto é aplicativo se a distância
     # angular é menor que o ângulo exato (os planetas estão convergindo)
-    current_dist = angular_distance(lon1, lon2)
     if current_dist < exact_angle:
         return not retro1 and not retro2
     return retro1 or retro2
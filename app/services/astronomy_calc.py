@@ -6,6 +6,7 @@ fornecendo funções de alto nível para cálculos astrológicos.
 """
 import swisseph as swe
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from app.models.schemas import (
     BirthData,
@@ -15,9 +16,9 @@ from app.models.schemas import (
     PlanetPosition,
     HOUSE_SYSTEM_CODES,
 )
-from app.services.zodiac import longitude_to_sign, determine_house
+from app.services.zodiac import longitudes_to_signs, determine_houses
 from app.services.aspects import calculate_aspects
-from app.config import get_settings
+from app.config import SETTINGS
 
 # Corpos celestes a calcular
 PLANET_IDS: dict[int, str] = {
@@ -36,13 +37,19 @@ PLANET_IDS: dict[int, str] = {
 # Inicializar Swiss Ephemeris com efemérides Moshier (built-in)
 swe.set_ephe_path("")
 
+# Pedir Moshier explicitamente: com o flag padrão (SEFLG_SWIEPH) cada chamada
+# procura os arquivos de efemérides antes de cair no Moshier.
+CALC_FLAGS = swe.FLG_MOSEPH | swe.FLG_SPEED
+
 
 def _parse_datetime(dt_str: str) -> datetime:
     """Converte string ISO 8601 para datetime UTC."""
-    dt_str = dt_str.replace("Z", "+00:00")
+    # Desde o Python 3.11, fromisoformat aceita o sufixo "Z" diretamente
     dt = datetime.fromisoformat(dt_str)
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        return dt.replace(tzinfo=timezone.utc)
+    if dt.tzinfo is timezone.utc:
+        return dt
     return dt.astimezone(timezone.utc)
 
 
@@ -52,39 +59,65 @@ def _datetime_to_jd(dt: datetime) -> float:
     return swe.julday(dt.year, dt.month, dt.day, hour_decimal)
 
 
-def _get_house_system_code(house_system: HouseSystem) -> bytes:
-    """Retorna o código Swiss Ephemeris para o sistema de casas."""
-    return HOUSE_SYSTEM_CODES.get(house_system.value, b"P")
+def _q4(x: float) -> float:
+    """Arredonda para 4 casas decimais sem o despacho genérico de round()."""
+    return int(x * 10000 + (0.5 if x >= 0 else -0.5)) / 10000.0
 
 
 def calculate_planet_positions(
     jd: float,
-    cusps: list[float] | None = None,
+    cusps: tuple[float, ...] | None = None,
 ) -> list[PlanetPosition]:
-    """Calcula as posições de todos os planetas para um dado Julian Day."""
-    positions: list[PlanetPosition] = []
+    """
+    Calcula as posições de todos os planetas para um dado Julian Day.
+
+    Sem cúspides (/planets/now e trânsitos "agora") o resultado é memoizado
+    por jd: como _datetime_to_jd descarta os microssegundos, chamadas no mesmo
+    segundo compartilham o cálculo e recebem cópias dos modelos, que podem ser
+    alteradas livremente. Com cúspides a chave (jd, cúspides) de um mapa natal
+    quase nunca se repete, então o cálculo é feito direto.
+    """
+    if cusps:
+        return list(_calculate_planet_positions(jd, tuple(cusps)))
+    return [position.model_copy() for position in _cached_planet_positions(jd)]
 
-    for planet_id, planet_name in PLANET_IDS.items():
-        result, flags = swe.calc_ut(jd, planet_id)
-        longitude = result[0]
-        speed = result[3]  # Velocidade em longitude (graus/dia)
 
-        sign, degree = longitude_to_sign(longitude)
-        retrograde = speed < 0
-        house = determine_house(longitude, cusps) if cusps else 0
+@lru_cache(maxsize=128)
+def _cached_planet_positions(jd: float) -> tuple[PlanetPosition, ...]:
+    return _calculate_planet_positions(jd, None)
 
+
+def _calculate_planet_positions(
+    jd: float,
+    cusps: tuple[float, ...] | None,
+) -> tuple[PlanetPosition, ...]:
+    longitudes: list[float] = []
+    speeds: list[float] = []
+    for planet_id in PLANET_IDS:
+        result, flags = swe.calc_ut(jd, planet_id, CALC_FLAGS)
+        longitudes.append(result[0])
+        speeds.append(result[3])  # Velocidade em longitude (graus/dia)
+
+    # Signos e casas de todos os planetas calculados em lote
+    signs = longitudes_to_signs(longitudes)
+    houses = determine_houses(longitudes, cusps) if cusps else [0] * len(longitudes)
+
+    positions: list[PlanetPosition] = []
+    for planet_name, longitude, speed, (sign, degree), house in zip(
+        PLANET_IDS.values(), longitudes, speeds, signs, houses
+    ):
         positions.append(
             PlanetPosition(
                 planet=planet_name,
                 sign=sign,
-                degree=round(degree, 4),
-                absolute_degree=round(longitude, 4),
+                degree=_q4(degree),
+                absolute_degree=_q4(longitude),
                 house=house,
-                retrograde=retrograde,
+                retrograde=speed < 0,
             )
         )
 
-    return positions
+    return tuple(positions)
 
 
 def calculate_houses(
@@ -92,53 +125,57 @@ def calculate_houses(
     latitude: float,
     longitude: float,
     house_system: HouseSystem = HouseSystem.PLACIDUS,
-) -> tuple[list[HouseCusp], PlanetPosition, PlanetPosition, list[float]]:
+) -> tuple[list[HouseCusp], PlanetPosition, PlanetPosition, tuple[float, ...]]:
     """
     Calcula as cúspides das casas, Ascendente e Meio do Céu.
 
     Retorna: (house_cusps, ascendant, midheaven, raw_cusps)
     """
-    hs_code = _get_house_system_code(house_system)
-    cusps, ascmc = swe.houses(jd, latitude, longitude, hs_code)
+    # HOUSE_SYSTEM_CODES é indexado pelo próprio enum: lookup direto
+    cusps, ascmc = swe.houses(jd, latitude, longitude, HOUSE_SYSTEM_CODES[house_system])
 
     # ascmc: [0]=ASC, [1]=MC, [2]=ARMC, [3]=Vertex, [4]=Equatorial ASC, etc.
     asc_longitude = ascmc[0]
     mc_longitude = ascmc[1]
 
-    raw_cusps = list(cusps)
+    # Tupla imutável e hasheável: serve direto como chave do cache de posições
+    raw_cusps = tuple(cusps)
+
+    # Signos das 12 cúspides, do Ascendente e do Meio do Céu em um só lote
+    signs = longitudes_to_signs([*cusps, asc_longitude, mc_longitude])
 
     # Construir lista de HouseCusp
     house_cusps: list[HouseCusp] = []
     for i in range(12):
         cusp_lon = cusps[i]
-        sign, degree = longitude_to_sign(cusp_lon)
+        sign, degree = signs[i]
         house_cusps.append(
             HouseCusp(
                 house=i + 1,
                 sign=sign,
-                degree=round(degree, 4),
-                absolute_degree=round(cusp_lon, 4),
+                degree=_q4(degree),
+                absolute_degree=_q4(cusp_lon),
             )
         )
 
     # Ascendente como PlanetPosition
-    asc_sign, asc_degree = longitude_to_sign(asc_longitude)
+    asc_sign, asc_degree = signs[12]
     ascendant = PlanetPosition(
         planet="Ascendant",
         sign=asc_sign,
-        degree=round(asc_degree, 4),
-        absolute_degree=round(asc_longitude, 4),
+        degree=_q4(asc_degree),
+        absolute_degree=_q4(asc_longitude),
         house=1,
         retrograde=False,
     )
 
     # Meio do Céu como PlanetPosition
-    mc_sign, mc_degree = longitude_to_sign(mc_longitude)
+    mc_sign, mc_degree = signs[13]
     midheaven = PlanetPosition(
         planet="Midheaven",
         sign=mc_sign,
-        degree=round(mc_degree, 4),
-        absolute_degree=round(mc_longitude, 4),
+        degree=_q4(mc_degree),
+        absolute_degree=_q4(mc_longitude),
         house=10,
         retrograde=False,
     )
@@ -160,8 +197,7 @@ def calculate_natal_chart(birth_data: BirthData) -> NatalChart:
     planets = calculate_planet_positions(jd, raw_cusps)
 
     # Calcular aspectos natais
-    settings = get_settings()
-    aspects = calculate_aspects(planets, orbs=settings.orbs)
+    aspects = calculate_aspects(planets, orbs=SETTINGS.orbs)
 
     return NatalChart(
         name=birth_data.name,
@@ -185,9 +221,6 @@ def calculate_current_positions() -> list[PlanetPosition]:
 
 def calculate_composite_midpoint(lon1: float, lon2: float) -> float:
     """Calcula o ponto médio entre duas longitudes eclípticas."""
-    diff = abs(lon1 - lon2)
-    if diff > 180:
-        midpoint = (lon1 + lon2) / 2 + 180
-    else:
-        midpoint = (lon1 + lon2) / 2
-    return midpoint % 360
+    # Se o arco direto passa de 180°, o ponto médio do arco curto fica no
+    # lado oposto: o booleano vira 0/1 e soma 180° sem desvio condicional
+    return ((lon1 + lon2) / 2 + 180.0 * (abs(lon1 - lon2) > 180)) % 360
@@ -6,10 +6,14 @@ Implementação completa seguindo as regras tradicionais de Hans Decoz
 Licenciado sob GNU Affero General Public License v3.0 (AGPL-3.0).
 Copyright (C) 2026 FW2B - Frameworks to Business
 """
+import time
 import unicodedata
 import re
+from functools import lru_cache
 from typing import Optional
 
+import orjson
+
 # ============================================================================
 # CONSTANTES
 # ============================================================================
@@ -27,11 +31,42 @@ STANDARD_VOWELS = set("AEIOU")
 # Números mestres reconhecidos
 MASTER_NUMBERS = {11, 22, 33}
 
+# Tabelas indexadas pelo código ASCII da letra. Nomes normalizados contêm
+# apenas A-Z e espaço, então `name.encode("ascii")` pode indexá-las direto.
+# _VALUE_TABLE cobre os 256 bytes para servir também de tabela de
+# bytes.translate: cada letra vira um byte com o seu valor pitagórico.
+_VALUE_TABLE = bytes(PYTHAGOREAN_TABLE.get(chr(i), 0) for i in range(256))
+_IS_VOWEL = bytes(chr(i) in STANDARD_VOWELS for i in range(128))
+
+
+# Padrão de limpeza do nome, compilado uma única vez
+_RE_NON_LETTER = re.compile(r"[^A-Z ]")
+
 
 # ============================================================================
 # FUNÇÕES AUXILIARES
 # ============================================================================
 
+def _strip_to_ascii_letters(text: str) -> str:
+    """Remove acentos, converte para maiúsculas e mantém apenas A-Z e espaços."""
+    # Decomposição Unicode para separar acentos
+    nfkd = unicodedata.normalize("NFKD", text)
+    # Remove combining characters (acentos)
+    ascii_text = "".join(c for c in nfkd if not unicodedata.combining(c))
+    # Converte para maiúsculas
+    upper = ascii_text.upper()
+    # Mantém apenas letras e espaços
+    return _RE_NON_LETTER.sub("", upper)
+
+
+# Tabela de str.translate com o resultado de _strip_to_ascii_letters para cada
+# caractere do ASCII ao Latim Estendido-B. Como os acentos removidos são
+# sempre marcas combinantes, aplicar a normalização caractere a caractere
+# equivale a aplicá-la ao nome inteiro.
+_NORMALIZE_TABLE = {i: _strip_to_ascii_letters(chr(i)) for i in range(0x250)}
+
+
+@lru_cache(maxsize=2048)
 def normalize_name(name: str) -> str:
     """
     Normaliza um nome para cálculo numerológico:
@@ -39,16 +74,12 @@ def normalize_name(name: str) -> str:
     - Converte para maiúsculas
     - Remove caracteres não-alfabéticos (exceto espaços)
     """
-    # Decomposição Unicode para separar acentos
-    nfkd = unicodedata.normalize("NFKD", name)
-    # Remove combining characters (acentos)
-    ascii_text = "".join(c for c in nfkd if not unicodedata.combining(c))
-    # Converte para maiúsculas
-    upper = ascii_text.upper()
-    # Mantém apenas letras e espaços
-    clean = re.sub(r"[^A-Z ]", "", upper)
+    clean = name.translate(_NORMALIZE_TABLE)
+    if not clean.isascii():
+        # Caracteres fora da tabela passam pela normalização Unicode completa
+        clean = _strip_to_ascii_letters(clean)
     # Remove espaços extras
-    return re.sub(r"\s+", " ", clean).strip()
+    return " ".join(clean.split())
 
 
 def _is_y_vowel_in_word(word: str, pos: int) -> bool:
@@ -117,50 +148,82 @@ def is_y_vowel(name: str, position: int) -> bool:
     if name[position] != "Y":
         return False
 
-    # Encontrar a palavra que contém a posição
-    words = name.split()
-    char_idx = 0
-    for word in words:
-        word_start = char_idx
-        word_end = char_idx + len(word)
-        if word_start <= position < word_end:
-            pos_in_word = position - word_start
-            return _is_y_vowel_in_word(word, pos_in_word)
-        char_idx = word_end + 1  # +1 para o espaço
+    # Delimitar a palavra que contém a posição
+    word_start = name.rfind(" ", 0, position) + 1
+    word_end = name.find(" ", position)
+    if word_end == -1:
+        word_end = len(name)
+    return _is_y_vowel_in_word(name[word_start:word_end], position - word_start)
 
-    return True  # fallback
 
+# Letra do nome normalizado: (índice da palavra, letra, valor, é vogal)
+NameLetter = tuple[int, str, int, bool]
 
-def classify_letters(name: str) -> tuple[list[tuple[str, int]], list[tuple[str, int]]]:
+
+@lru_cache(maxsize=1024)
+def _compute_name_letter_values(full_name: str) -> tuple[NameLetter, ...]:
+    """
+    Percorre o nome normalizado uma única vez e devolve, para cada letra,
+    a palavra a que pertence, seu valor pitagórico e se conta como vogal
+    (com Y tratado contextualmente). Todos os números derivados do nome
+    (Expressão, Alma, Personalidade, Ativo, Legado, Ausentes) partem daqui.
+    """
+    normalized = normalize_name(full_name)
+
+    # Classificar todos os Y em uma única passada pelas palavras; y_flags
+    # fica alinhado por índice com o nome normalizado (1 = Y vogal)
+    y_flags = bytearray(len(normalized))
+    word_start = 0
+    for word in normalized.split(" "):
+        pos = word.find("Y")
+        while pos != -1:
+            y_flags[word_start + pos] = _is_y_vowel_in_word(word, pos)
+            pos = word.find("Y", pos + 1)
+        word_start += len(word) + 1  # +1 para o espaço
+
+    letters: list[NameLetter] = []
+    word_index = 0
+    for i, (char, code) in enumerate(zip(normalized, normalized.encode("ascii"))):
+        value = _VALUE_TABLE[code]
+        if value == 0:
+            word_index += 1  # só espaços têm valor 0 no nome normalizado
+            continue
+        letters.append((word_index, char, value, bool(_IS_VOWEL[code] or y_flags[i])))
+
+    return tuple(letters)
+
+
+@lru_cache(maxsize=1024)
+def classify_letters(
+    name: str,
+) -> tuple[tuple[tuple[str, int], ...], tuple[tuple[str, int], ...]]:
     """
     Classifica as letras de um nome em vogais e consoantes,
     tratando Y contextualmente.
 
-    Retorna: (vogais, consoantes) como listas de tuplas (letra, valor).
+    Retorna: (vogais, consoantes) como tuplas de pares (letra, valor).
+    O resultado é memoizado, por isso usa tuplas imutáveis.
     """
-    normalized = normalize_name(name)
-    vowels: list[tuple[str, int]] = []
-    consonants: list[tuple[str, int]] = []
+    letters = _compute_name_letter_values(name)
+    vowels = tuple((char, value) for _, char, value, is_vowel in letters if is_vowel)
+    consonants = tuple(
+        (char, value) for _, char, value, is_vowel in letters if not is_vowel
+    )
+    return vowels, consonants
 
-    for i, char in enumerate(normalized):
-        if char == " ":
-            continue
 
-        value = PYTHAGOREAN_TABLE.get(char, 0)
-        if value == 0:
-            continue
+def _letter_sum(text: str) -> int:
+    """Soma os valores pitagóricos de um texto normalizado inteiramente em C."""
+    return sum(text.encode("ascii").translate(_VALUE_TABLE))
 
-        if char in STANDARD_VOWELS:
-            vowels.append((char, value))
-        elif char == "Y":
-            if is_y_vowel(normalized, i):
-                vowels.append((char, value))
-            else:
-                consonants.append((char, value))
-        else:
-            consonants.append((char, value))
 
-    return vowels, consonants
+def _digit_sum(number: int) -> int:
+    """Soma os dígitos decimais de um inteiro não negativo, sem passar por str."""
+    total = 0
+    while number:
+        total += number % 10
+        number //= 10
+    return total
 
 
 def reduce_to_single_digit(number: int, keep_master: bool = True) -> int:
@@ -171,7 +234,7 @@ def reduce_to_single_digit(number: int, keep_master: bool = True) -> int:
     while number > 9:
         if keep_master and number in MASTER_NUMBERS:
             return number
-        number = sum(int(d) for d in str(number))
+        number = _digit_sum(number)
     return number
 
 
@@ -183,7 +246,7 @@ def reduce_date_part(number: int) -> int:
     return reduce_to_single_digit(number, keep_master=True)
 
 
-def sum_letter_values(letters: list[tuple[str, int]]) -> int:
+def sum_letter_values(letters: tuple[tuple[str, int], ...]) -> int:
     """Soma os valores numéricos de uma lista de letras."""
     return sum(value for _, value in letters)
 
@@ -205,10 +268,15 @@ def calculate_life_path(day: int, month: int, year: int) -> dict:
     - Ano: 1976 → 1+9+7+6 = 23 → 2+3 = 5
     - Soma: 5 + 4 + 5 = 14 → 1+4 = 5
     """
-    reduced_day = reduce_date_part(day)
-    reduced_month = reduce_date_part(month)
-    reduced_year = reduce_date_part(year)
+    return _calculate_life_path_from_reduced(
+        reduce_date_part(day), reduce_date_part(month), reduce_date_part(year)
+    )
 
+
+def _calculate_life_path_from_reduced(
+    reduced_day: int, reduced_month: int, reduced_year: int
+) -> dict:
+    """Life Path a partir de dia, mês e ano já reduzidos."""
     total = reduced_day + reduced_month + reduced_year
     life_path = reduce_to_single_digit(total, keep_master=True)
 
@@ -227,18 +295,13 @@ def calculate_expression(full_name: str) -> dict:
     Calcula o Número de Expressão / Destino (Expression / Destiny Number).
     Soma de TODAS as letras do nome completo de nascimento.
     """
-    normalized = normalize_name(full_name)
-    total = 0
-    letter_values = []
+    return _calculate_expression_from_letters(_compute_name_letter_values(full_name))
 
-    for char in normalized:
-        if char == " ":
-            continue
-        value = PYTHAGOREAN_TABLE.get(char, 0)
-        if value > 0:
-            letter_values.append({"letter": char, "value": value})
-            total += value
 
+def _calculate_expression_from_letters(letters: tuple[NameLetter, ...]) -> dict:
+    """Expressão a partir das letras já classificadas do nome."""
+    letter_values = [{"letter": char, "value": value} for _, char, value, _ in letters]
+    total = sum(value for _, _, value, _ in letters)
     expression = reduce_to_single_digit(total, keep_master=True)
 
     return {
@@ -254,15 +317,20 @@ def calculate_soul_urge(full_name: str) -> dict:
     Calcula o Número da Motivação / Desejo da Alma (Soul Urge / Heart's Desire).
     Soma apenas das VOGAIS do nome completo.
     """
-    vowels, _ = classify_letters(full_name)
-    total = sum_letter_values(vowels)
+    return _calculate_soul_urge_from_letters(_compute_name_letter_values(full_name))
+
+
+def _calculate_soul_urge_from_letters(letters: tuple[NameLetter, ...]) -> dict:
+    """Motivação a partir das letras já classificadas do nome."""
+    vowels = [{"letter": char, "value": value} for _, char, value, is_vowel in letters if is_vowel]
+    total = sum(v["value"] for v in vowels)
     soul_urge = reduce_to_single_digit(total, keep_master=True)
 
     return {
         "number": soul_urge,
         "total_before_reduction": total,
         "is_master_number": soul_urge in MASTER_NUMBERS,
-        "vowels": [{"letter": l, "value": v} for l, v in vowels],
+        "vowels": vowels,
     }
 
 
@@ -271,15 +339,22 @@ def calculate_personality(full_name: str) -> dict:
     Calcula o Número da Personalidade (Personality Number).
     Soma apenas das CONSOANTES do nome completo.
     """
-    _, consonants = classify_letters(full_name)
-    total = sum_letter_values(consonants)
+    return _calculate_personality_from_letters(_compute_name_letter_values(full_name))
+
+
+def _calculate_personality_from_letters(letters: tuple[NameLetter, ...]) -> dict:
+    """Personalidade a partir das letras já classificadas do nome."""
+    consonants = [
+        {"letter": char, "value": value} for _, char, value, is_vowel in letters if not is_vowel
+    ]
+    total = sum(c["value"] for c in consonants)
     personality = reduce_to_single_digit(total, keep_master=True)
 
     return {
         "number": personality,
         "total_before_reduction": total,
         "is_master_number": personality in MASTER_NUMBERS,
-        "consonants": [{"letter": l, "value": v} for l, v in consonants],
+        "consonants": consonants,
     }
 
 
@@ -336,9 +411,13 @@ def calculate_active_number(first_name: str) -> dict:
     Calcula o Número Ativo (Active Number).
     Soma de todas as letras do primeiro nome.
     """
-    normalized = normalize_name(first_name)
-    first = normalized.split()[0] if normalized.split() else normalized
-    total = sum(PYTHAGOREAN_TABLE.get(c, 0) for c in first if c != " ")
+    return _calculate_active_from_letters(_compute_name_letter_values(first_name))
+
+
+def _calculate_active_from_letters(letters: tuple[NameLetter, ...]) -> dict:
+    """Número Ativo a partir das letras já classificadas do nome."""
+    first = "".join(char for word_index, char, _, _ in letters if word_index == 0)
+    total = _letter_sum(first)
     active = reduce_to_single_digit(total, keep_master=True)
 
     return {
@@ -354,10 +433,14 @@ def calculate_legacy_number(last_name: str) -> dict:
     Calcula o Número Hereditário / Legado (Legacy / Hereditary Number).
     Soma de todas as letras do sobrenome.
     """
-    normalized = normalize_name(last_name)
-    parts = normalized.split()
-    last = parts[-1] if parts else normalized
-    total = sum(PYTHAGOREAN_TABLE.get(c, 0) for c in last if c != " ")
+    return _calculate_legacy_from_letters(_compute_name_letter_values(last_name))
+
+
+def _calculate_legacy_from_letters(letters: tuple[NameLetter, ...]) -> dict:
+    """Número Hereditário a partir das letras já classificadas do nome."""
+    last_index = letters[-1][0] if letters else 0
+    last = "".join(char for word_index, char, _, _ in letters if word_index == last_index)
+    total = _letter_sum(last)
     legacy = reduce_to_single_digit(total, keep_master=True)
 
     return {
@@ -373,22 +456,22 @@ def calculate_missing_numbers(full_name: str) -> dict:
     Calcula os Números Ausentes / Lições Cármicas (Missing Numbers / Karmic Lessons).
     Números de 1 a 9 que não aparecem em nenhuma letra do nome.
     """
-    normalized = normalize_name(full_name)
-    present_values = set()
+    return _calculate_missing_from_letters(_compute_name_letter_values(full_name))
 
-    for char in normalized:
-        if char == " ":
-            continue
-        value = PYTHAGOREAN_TABLE.get(char, 0)
-        if value > 0:
-            present_values.add(value)
 
-    all_numbers = set(range(1, 10))
-    missing = sorted(all_numbers - present_values)
+def _calculate_missing_from_letters(letters: tuple[NameLetter, ...]) -> dict:
+    """Números Ausentes a partir das letras já classificadas do nome."""
+    # Bit n ligado = valor n presente no nome
+    mask = 0
+    for _, _, value, _ in letters:
+        mask |= 1 << value
+
+    present = [n for n in range(1, 10) if mask >> n & 1]
+    missing = [n for n in range(1, 10) if not mask >> n & 1]
 
     return {
         "missing_numbers": missing,
-        "present_numbers": sorted(present_values),
+        "present_numbers": present,
         "karmic_lessons_count": len(missing),
     }
 
@@ -405,9 +488,14 @@ def calculate_pinnacle_cycles(day: int, month: int, year: int) -> dict:
     rd = reduce_date_part(day)
     rm = reduce_date_part(month)
     ry = reduce_date_part(year)
+    lp = _calculate_life_path_from_reduced(rd, rm, ry)["number"]
+    return _calculate_pinnacles_from_reduced(rd, rm, ry, lp, year)
 
-    life_path_data = calculate_life_path(day, month, year)
-    lp = life_path_data["number"]
+
+def _calculate_pinnacles_from_reduced(
+    rd: int, rm: int, ry: int, lp: int, birth_year: int
+) -> dict:
+    """Pináculos a partir das partes reduzidas da data e do Life Path."""
     # Se for número mestre, usar o valor reduzido para o cálculo de idade
     lp_single = reduce_to_single_digit(lp, keep_master=False)
 
@@ -418,8 +506,6 @@ def calculate_pinnacle_cycles(day: int, month: int, year: int) -> dict:
     p3 = reduce_to_single_digit(p1 + p2, keep_master=True)
     p4 = reduce_to_single_digit(rm + ry, keep_master=True)
 
-    birth_year = year
-
     return {
         "pinnacles": [
             {
@@ -471,10 +557,13 @@ def calculate_challenge_numbers(day: int, month: int, year: int) -> dict:
     - 3° Desafio: |1° - 2°|
     - 4° Desafio: |Mês - Ano|
     """
-    rd = reduce_date_part(day)
-    rm = reduce_date_part(month)
-    ry = reduce_date_part(year)
+    return _calculate_challenges_from_reduced(
+        reduce_date_part(day), reduce_date_part(month), reduce_date_part(year)
+    )
 
+
+def _calculate_challenges_from_reduced(rd: int, rm: int, ry: int) -> dict:
+    """Desafios a partir das partes reduzidas da data."""
     c1 = reduce_to_single_digit(abs(rm - rd), keep_master=False)
     c2 = reduce_to_single_digit(abs(rd - ry), keep_master=False)
     c3 = reduce_to_single_digit(abs(c1 - c2), keep_master=False)
@@ -495,11 +584,14 @@ def calculate_personal_year(day: int, month: int, current_year: int) -> dict:
     Calcula o Ano Pessoal (Personal Year).
     Soma do dia de nascimento + mês de nascimento + ano atual.
     """
-    rd = reduce_date_part(day)
-    rm = reduce_date_part(month)
-    ry = reduce_date_part(current_year)
+    return _calculate_personal_year_from_reduced(
+        reduce_date_part(day), reduce_date_part(month), current_year
+    )
 
-    total = rd + rm + ry
+
+def _calculate_personal_year_from_reduced(rd: int, rm: int, current_year: int) -> dict:
+    """Ano Pessoal a partir do dia e mês de nascimento já reduzidos."""
+    total = rd + rm + reduce_date_part(current_year)
     personal_year = reduce_to_single_digit(total, keep_master=True)
 
     return {
@@ -554,30 +646,78 @@ def calculate_full_profile(
 ) -> dict:
     """
     Calcula o perfil numerológico completo de uma pessoa.
-    """
-    from datetime import datetime
 
-    now = datetime.utcnow()
+    O resultado é memoizado pela data atual já resolvida, então uma mudança
+    de dia gera uma nova entrada em vez de servir um perfil antigo. O cache
+    guarda o perfil serializado e cada chamada recebe um dict novo, que pode
+    ser alterado sem afetar as chamadas seguintes.
+    """
+    today = time.gmtime()
     if current_year is None:
-        current_year = now.year
+        current_year = today.tm_year
     if current_month is None:
-        current_month = now.month
+        current_month = today.tm_mon
     if current_day is None:
-        current_day = now.day
+        current_day = today.tm_mday
+
+    return orjson.loads(
+        _cached_full_profile_json(
+            full_name, day, month, year, current_year, current_month, current_day
+        )
+    )
+
+
+@lru_cache(maxsize=2048)
+def _cached_full_profile_json(
+    full_name: str,
+    day: int,
+    month: int,
+    year: int,
+    current_year: int,
+    current_month: int,
+    current_day: int,
+) -> bytes:
+    """
+    Perfil memoizado em JSON. Os bytes são imutáveis, e o orjson.loads em C
+    devolve uma cópia profunda a cada acerto do cache por menos da metade do
+    custo de recalcular (copy.deepcopy custaria mais que o próprio cálculo).
+    """
+    return orjson.dumps(
+        _calculate_full_profile(
+            full_name, day, month, year, current_year, current_month, current_day
+        )
+    )
+
+
+def _calculate_full_profile(
+    full_name: str,
+    day: int,
+    month: int,
+    year: int,
+    current_year: int,
+    current_month: int,
+    current_day: int,
+) -> dict:
+    # Cada parte da data é reduzida uma única vez e compartilhada
+    rd = reduce_date_part(day)
+    rm = reduce_date_part(month)
+    ry = reduce_date_part(year)
 
-    life_path = calculate_life_path(day, month, year)
-    expression = calculate_expression(full_name)
-    soul_urge = calculate_soul_urge(full_name)
-    personality = calculate_personality(full_name)
+    life_path = _calculate_life_path_from_reduced(rd, rm, ry)
+    # O nome é percorrido uma única vez para todos os números derivados dele
+    letters = _compute_name_letter_values(full_name)
+    expression = _calculate_expression_from_letters(letters)
+    soul_urge = _calculate_soul_urge_from_letters(letters)
+    personality = _calculate_personality_from_letters(letters)
     birthday = calculate_birthday_number(day)
     maturity = calculate_maturity_number(life_path["number"], expression["number"])
     power_name = calculate_power_name_number(soul_urge["number"], personality["number"])
-    active = calculate_active_number(full_name)
-    legacy = calculate_legacy_number(full_name)
-    missing = calculate_missing_numbers(full_name)
-    pinnacles = calculate_pinnacle_cycles(day, month, year)
-    challenges = calculate_challenge_numbers(day, month, year)
-    personal_year = calculate_personal_year(day, month, current_year)
+    active = _calculate_active_from_letters(letters)
+    legacy = _calculate_legacy_from_letters(letters)
+    missing = _calculate_missing_from_letters(letters)
+    pinnacles = _calculate_pinnacles_from_reduced(rd, rm, ry, life_path["number"], year)
+    challenges = _calculate_challenges_from_reduced(rd, rm, ry)
+    personal_year = _calculate_personal_year_from_reduced(rd, rm, current_year)
     personal_month = calculate_personal_month(personal_year["number"], current_month)
     personal_day = calculate_personal_day(personal_month["number"], current_day)
 
@@ -614,6 +754,67 @@ def calculate_full_profile(
 # COMPATIBILIDADE NUMEROLÓGICA
 # ============================================================================
 
+# Matriz de compatibilidade numerológica, montada uma única vez na importação.
+# Baseada em fontes tradicionais de numerologia pitagórica.
+# Escala: 0 (incompatível) a 100 (altamente compatível).
+# Definições de compatibilidade (min, max) → score
+_COMPAT_DATA: dict[tuple[int, int], int] = {
+    # Número 1
+    (1, 1): 70, (1, 2): 55, (1, 3): 85, (1, 4): 50, (1, 5): 90,
+    (1, 6): 60, (1, 7): 65, (1, 8): 55, (1, 9): 80,
+    # Número 2
+    (2, 2): 75, (2, 3): 80, (2, 4): 85, (2, 5): 45, (2, 6): 90,
+    (2, 7): 60, (2, 8): 70, (2, 9): 65,
+    # Número 3
+    (3, 3): 80, (3, 4): 40, (3, 5): 90, (3, 6): 85, (3, 7): 55,
+    (3, 8): 50, (3, 9): 95,
+    # Número 4
+    (4, 4): 75, (4, 5): 35, (4, 6): 80, (4, 7): 70, (4, 8): 90,
+    (4, 9): 40,
+    # Número 5
+    (5, 5): 70, (5, 6): 45, (5, 7): 80, (5, 8): 55, (5, 9): 75,
+    # Número 6
+    (6, 6): 85, (6, 7): 40, (6, 8): 60, (6, 9): 90,
+    # Número 7
+    (7, 7): 80, (7, 8): 45, (7, 9): 55,
+    # Número 8
+    (8, 8): 75, (8, 9): 50,
+    # Número 9
+    (9, 9): 70,
+}
+
+
+# Maior número possível após a redução: o mestre 33
+_COMPAT_SIZE = 34
+
+
+def _build_compat_table() -> tuple[float, ...]:
+    """
+    Expande _COMPAT_DATA numa tabela simétrica 34x34 achatada, indexada por
+    n1 * 34 + n2. As linhas dos números mestres (11, 22, 33) já apontam para
+    a pontuação do valor reduzido. Pares sem definição (incluindo o 0) valem 50.
+    """
+    base = [[50.0] * 10 for _ in range(10)]
+    for (a, b), score in _COMPAT_DATA.items():
+        base[a][b] = base[b][a] = float(score)
+
+    reduced = [reduce_to_single_digit(n, keep_master=False) for n in range(_COMPAT_SIZE)]
+    return tuple(
+        base[reduced[i]][reduced[j]]
+        for i in range(_COMPAT_SIZE)
+        for j in range(_COMPAT_SIZE)
+    )
+
+
+_COMPAT_TABLE: tuple[float, ...] = _build_compat_table()
+
+# Pesos da pontuação geral; os mesmos valores são devolvidos na resposta
+_WEIGHT_LIFE_PATH = 0.40
+_WEIGHT_SOUL_URGE = 0.25
+_WEIGHT_EXPRESSION = 0.20
+_WEIGHT_PERSONALITY = 0.15
+
+
 def calculate_compatibility(
     name1: str, day1: int, month1: int, year1: int,
     name2: str, day2: int, month2: int, year2: int,
@@ -625,27 +826,28 @@ def calculate_compatibility(
     profile1 = calculate_full_profile(name1, day1, month1, year1)
     profile2 = calculate_full_profile(name2, day2, month2, year2)
 
-    # Tabela de compatibilidade baseada em numerologia tradicional
-    # Cada par de números tem uma pontuação de 0 a 100
-    compatibility_matrix = _build_compatibility_matrix()
-
-    lp1 = profile1["core_numbers"]["life_path"]["number"]
-    lp2 = profile2["core_numbers"]["life_path"]["number"]
-    ex1 = profile1["core_numbers"]["expression"]["number"]
-    ex2 = profile2["core_numbers"]["expression"]["number"]
-    su1 = profile1["core_numbers"]["soul_urge"]["number"]
-    su2 = profile2["core_numbers"]["soul_urge"]["number"]
-    pe1 = profile1["core_numbers"]["personality"]["number"]
-    pe2 = profile2["core_numbers"]["personality"]["number"]
-
-    lp_compat = _get_compatibility_score(lp1, lp2, compatibility_matrix)
-    ex_compat = _get_compatibility_score(ex1, ex2, compatibility_matrix)
-    su_compat = _get_compatibility_score(su1, su2, compatibility_matrix)
-    pe_compat = _get_compatibility_score(pe1, pe2, compatibility_matrix)
+    cn1 = profile1["core_numbers"]
+    cn2 = profile2["core_numbers"]
+    lp1 = cn1["life_path"]["number"]
+    lp2 = cn2["life_path"]["number"]
+    ex1 = cn1["expression"]["number"]
+    ex2 = cn2["expression"]["number"]
+    su1 = cn1["soul_urge"]["number"]
+    su2 = cn2["soul_urge"]["number"]
+    pe1 = cn1["personality"]["number"]
+    pe2 = cn2["personality"]["number"]
+
+    lp_compat = _get_compatibility_score(lp1, lp2)
+    ex_compat = _get_compatibility_score(ex1, ex2)
+    su_compat = _get_compatibility_score(su1, su2)
+    pe_compat = _get_compatibility_score(pe1, pe2)
 
     # Pesos: Life Path (40%), Soul Urge (25%), Expression (20%), Personality (15%)
     overall = round(
-        lp_compat * 0.40 + su_compat * 0.25 + ex_compat * 0.20 + pe_compat * 0.15,
+        lp_compat * _WEIGHT_LIFE_PATH
+        + su_compat * _WEIGHT_SOUL_URGE
+        + ex_compat * _WEIGHT_EXPRESSION
+        + pe_compat * _WEIGHT_PERSONALITY,
         1,
     )
 
@@ -666,65 +868,19 @@ def calculate_compatibility(
         },
         "compatibility": {
             "overall_score": overall,
-            "life_path": {"score": lp_compat, "weight": 0.40},
-            "expression": {"score": ex_compat, "weight": 0.20},
-            "soul_urge": {"score": su_compat, "weight": 0.25},
-            "personality": {"score": pe_compat, "weight": 0.15},
+            "life_path": {"score": lp_compat, "weight": _WEIGHT_LIFE_PATH},
+            "expression": {"score": ex_compat, "weight": _WEIGHT_EXPRESSION},
+            "soul_urge": {"score": su_compat, "weight": _WEIGHT_SOUL_URGE},
+            "personality": {"score": pe_compat, "weight": _WEIGHT_PERSONALITY},
         },
         "profile1": profile1,
         "profile2": profile2,
     }
 
 
-def _get_compatibility_score(n1: int, n2: int, matrix: dict) -> float:
-    """Obtém a pontuação de compatibilidade entre dois números."""
-    # Para números mestres, usar tanto o valor mestre quanto o reduzido
-    key = (min(n1, n2), max(n1, n2))
-    if key in matrix:
-        return matrix[key]
-
-    # Se um dos números é mestre, tentar com o valor reduzido
-    r1 = reduce_to_single_digit(n1, keep_master=False)
-    r2 = reduce_to_single_digit(n2, keep_master=False)
-    key_reduced = (min(r1, r2), max(r1, r2))
-    return matrix.get(key_reduced, 50.0)
-
-
-def _build_compatibility_matrix() -> dict[tuple[int, int], float]:
-    """
-    Constrói a matriz de compatibilidade numerológica.
-    Baseada em fontes tradicionais de numerologia pitagórica.
-    Escala: 0 (incompatível) a 100 (altamente compatível).
-    """
-    m: dict[tuple[int, int], float] = {}
-
-    # Definições de compatibilidade (min, max) → score
-    data = {
-        # Número 1
-        (1, 1): 70, (1, 2): 55, (1, 3): 85, (1, 4): 50, (1, 5): 90,
-        (1, 6): 60, (1, 7): 65, (1, 8): 55, (1, 9): 80,
-        # Número 2
-        (2, 2): 75, (2, 3): 80, (2, 4): 85, (2, 5): 45, (2, 6): 90,
-        (2, 7): 60, (2, 8): 70, (2, 9): 65,
-        # Número 3
-        (3, 3): 80, (3, 4): 40, (3, 5): 90, (3, 6): 85, (3, 7): 55,
-        (3, 8): 50, (3, 9): 95,
-        # Número 4
-        (4, 4): 75, (4, 5): 35, (4, 6): 80, (4, 7): 70, (4, 8): 90,
-        (4, 9): 40,
-        # Número 5
-        (5, 5): 70, (5, 6): 45, (5, 7): 80, (5, 8): 55, (5, 9): 75,
-        # Número 6
-        (6, 6): 85, (6, 7): 40, (6, 8): 60, (6, 9): 90,
-        # Número 7
-        (7, 7): 80, (7, 8): 45, (7, 9): 55,
-        # Número 8
-        (8, 8): 75, (8, 9): 50,
-        # Número 9
-        (9, 9): 70,
-    }
-
-    for key, score in data.items():
-        m[key] = float(score)
-
-    return m
+def _get_compatibility_score(n1: int, n2: int) -> float:
+    """
+    Obtém a pontuação de compatibilidade entre dois números. Os números
+    chegam reduzidos (0-9 ou mestres até 33), sempre dentro da tabela.
+    """
+    return _COMPAT_TABLE[n1 * _COMPAT_SIZE + n2]
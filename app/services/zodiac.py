@@ -1,32 +1,102 @@
 """
 AstroEngine API - Conversão de coordenadas eclípticas para signos zodiacais
 """
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Final
 
-SIGNS = [
+SIGNS: Final[tuple[str, ...]] = (
     "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
     "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces",
-]
+)
 
 
 def longitude_to_sign(longitude: float) -> tuple[str, float]:
     """Converte longitude eclíptica (0-360) para signo e grau dentro do signo."""
-    longitude = longitude % 360
-    sign_index = int(longitude // 30)
-    degree_in_sign = round(longitude % 30, 4)
-    return SIGNS[sign_index], degree_in_sign
+    return longitudes_to_signs([longitude])[0]
 
 
-def determine_house(longitude: float, cusps: list[float]) -> int:
+def longitudes_to_signs(longitudes: list[float]) -> list[tuple[str, float]]:
+    """Versão em lote de longitude_to_sign, sem uma chamada de função por longitude."""
+    signs = SIGNS
+    result: list[tuple[str, float]] = []
+    for longitude in longitudes:
+        longitude = longitude % 360
+        sign_index = int(longitude // 30)
+        if sign_index == 12:
+            # Negativos ínfimos (ex.: -1e-300) arredondam para 360.0 no `% 360`
+            result.append((signs[0], 0.0))
+        else:
+            # Subtração exata (lema de Sterbenz): mesmo valor de longitude % 30
+            result.append((signs[sign_index], round(longitude - sign_index * 30, 4)))
+    return result
+
+
+def determine_house(longitude: float, cusps: tuple[float, ...]) -> int:
     """Determina em qual casa astrológica uma longitude eclíptica se encontra."""
-    longitude = longitude % 360
+    return determine_houses([longitude], cusps)[0]
+
+
+@lru_cache(maxsize=256)
+def _cusp_bounds(cusps: tuple[float, ...]) -> tuple[tuple[int, float, float, bool], ...]:
+    """
+    Prepara (casa, início, fim, cruza 0° Áries) para cada casa de um conjunto
+    de cúspides. Memoizado: varreduras de trânsito sobre o mesmo mapa natal
+    reaproveitam a preparação em vez de normalizar as cúspides a cada chamada.
+    """
+    bounds = []
     for i in range(12):
         cusp_start = cusps[i] % 360
         cusp_end = cusps[(i + 1) % 12] % 360
-        if cusp_start < cusp_end:
-            if cusp_start <= longitude < cusp_end:
-                return i + 1
+        bounds.append((i + 1, cusp_start, cusp_end, not cusp_start < cusp_end))
+    return tuple(bounds)
+
+
+@lru_cache(maxsize=256)
+def _rotated_cusps(cusps: tuple[float, ...]) -> tuple[tuple[float, ...], int] | None:
+    """
+    Gira as cúspides normalizadas para começarem pela menor e devolve
+    (cúspides giradas, deslocamento), permitindo busca binária da casa.
+    Devolve None se as cúspides não forem estritamente crescentes ao redor
+    do círculo (cúspides repetidas ou fora de ordem); nesse caso vale a
+    varredura linear.
+    """
+    normalized = [cusp % 360 for cusp in cusps]
+    offset = normalized.index(min(normalized))
+    rotated = tuple(normalized[offset:] + normalized[:offset])
+    if any(a >= b for a, b in zip(rotated, rotated[1:])):
+        return None
+    return rotated, offset
+
+
+def determine_houses(longitudes: list[float], cusps: tuple[float, ...]) -> list[int]:
+    """
+    Versão em lote de determine_house: usa as cúspides preparadas uma única
+    vez e atribui a casa de todas as longitudes em uma só passada.
+    """
+    key = tuple(cusps)
+    rotated_cusps = _rotated_cusps(key)
+    if rotated_cusps is not None:
+        rotated, offset = rotated_cusps
+        # Índice da maior cúspide <= longitude; -1 (antes da menor cúspide)
+        # cai na casa que cruza 0° Áries, a da última cúspide girada
+        return [
+            (bisect_right(rotated, longitude % 360) - 1 + offset) % 12 + 1
+            for longitude in longitudes
+        ]
+
+    bounds = _cusp_bounds(key)
+    houses: list[int] = []
+    for longitude in longitudes:
+        longitude = longitude % 360
+        for house, cusp_start, cusp_end, wraps in bounds:
+            if wraps:
+                # A casa cruza o ponto 0° Áries
+                if longitude >= cusp_start or longitude < cusp_end:
+                    break
+            elif cusp_start <= longitude < cusp_end:
+                break
         else:
-            # A casa cruza o ponto 0° Áries
-            if longitude >= cusp_start or longitude < cusp_end:
-                return i + 1
-    return 1  # Fallback
+            house = 1  # Fallback
+        houses.append(house)
+    return houses
@@ -1,10 +1,17 @@
 """
 Testes para o endpoint /natal_chart e cálculos astrológicos.
 """
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.models.schemas import PlanetPosition
+from app.services.aspects import calculate_aspects
 
 client = TestClient(app)
 API_KEY = "dev-key-cosmic-suite"
@@ -19,6 +26,14 @@ BIRTH_DATA = {
 }
 
 
+@pytest.fixture(scope="module")
+def natal_data():
+    """Mapa natal de BIRTH_DATA, calculado uma única vez para os testes que só leem a resposta."""
+    response = client.post("/natal_chart", json=BIRTH_DATA, headers=HEADERS)
+    assert response.status_code == 200
+    return response.json()
+
+
 def test_natal_chart_success():
     """Testa se o endpoint retorna um mapa natal completo."""
     response = client.post("/natal_chart", json=BIRTH_DATA, headers=HEADERS)
@@ -33,10 +48,9 @@ def test_natal_chart_success():
     assert len(data["aspects"]) > 0
 
 
-def test_natal_chart_planet_signs():
+def test_natal_chart_planet_signs(natal_data):
     """Testa se os signos dos planetas estão corretos para a data de teste."""
-    response = client.post("/natal_chart", json=BIRTH_DATA, headers=HEADERS)
-    data = response.json()
+    data = natal_data
 
     planets_by_name = {p["planet"]: p for p in data["planets"]}
 
@@ -50,12 +64,9 @@ def test_natal_chart_planet_signs():
     assert data["midheaven"]["sign"] == "Pisces"
 
 
-def test_natal_chart_houses_placidus():
+def test_natal_chart_houses_placidus(natal_data):
     """Testa se as 12 casas são calculadas corretamente em Placidus."""
-    response = client.post("/natal_chart", json=BIRTH_DATA, headers=HEADERS)
-    data = response.json()
-
-    houses = data["houses"]
+    houses = natal_data["houses"]
     assert len(houses) == 12
     for i, house in enumerate(houses):
         assert house["house"] == i + 1
@@ -70,16 +81,45 @@ def test_natal_chart_different_house_systems():
         assert response.status_code == 200
 
 
-def test_natal_chart_retrograde_detection():
+def test_natal_chart_retrograde_detection(natal_data):
     """Testa se a detecção de retrogradação funciona."""
-    response = client.post("/natal_chart", json=BIRTH_DATA, headers=HEADERS)
-    data = response.json()
-
-    planets_by_name = {p["planet"]: p for p in data["planets"]}
+    planets_by_name = {p["planet"]: p for p in natal_data["planets"]}
     # Plutão estava retrógrado em 15/03/1990
     assert planets_by_name["Pluto"]["retrograde"] is True
 
 
+def _position(planet: str, longitude: float) -> PlanetPosition:
+    return PlanetPosition(
+        planet=planet, sign="Aries", degree=0.0, absolute_degree=longitude,
+        house=1, retrograde=False,
+    )
+
+
+def test_aspects_wide_orb_first_in_order():
+    """Testa se, com orbe largo, vale o primeiro aspecto em ordem cujo orbe contém a distância."""
+    orbs = {"conjunction": 8, "sextile": 6, "square": 20, "trine": 8, "opposition": 8}
+    aspects = calculate_aspects([_position("Sun", 0.0), _position("Moon", 108.0)], orbs=orbs)
+    assert len(aspects) == 1
+    assert aspects[0].aspect_type == "square"
+    assert aspects[0].orb == 18.0
+
+
+def test_aspects_orb_edge_inside_degree_bucket():
+    """Testa distâncias logo abaixo de um grau inteiro na borda de um orbe fracionário."""
+    orbs = {"conjunction": 8, "sextile": 8.5, "square": 15.5, "trine": 16, "opposition": 8}
+    sun = _position("Sun", 0.0)
+
+    # Borda inferior do sextil em 51.5°: o grau 51 contém posições dentro e fora do orbe
+    inside = calculate_aspects([sun, _position("Moon", 51.99999)], orbs=orbs)
+    assert [a.aspect_type for a in inside] == ["sextile"]
+    assert calculate_aspects([sun, _position("Moon", 51.49999)], orbs=orbs) == []
+
+    # 104.99999° cabe na quadratura (até 105.5°) e no trígono (desde 104°):
+    # vale a quadratura, que vem antes em ASPECT_ANGLES
+    both = calculate_aspects([sun, _position("Moon", 104.99999)], orbs=orbs)
+    assert [a.aspect_type for a in both] == ["square"]
+
+
 def test_natal_chart_no_api_key():
     """Testa se a API rejeita requisições sem chave."""
     response = client.post("/natal_chart", json=BIRTH_DATA)
@@ -93,6 +133,20 @@ def test_natal_chart_invalid_api_key():
     assert response.status_code == 403
 
 
+def test_rate_limit_exceeded():
+    """Testa se o rate limiting responde 429 ao exceder o limite por minuto."""
+    limiter = RateLimitMiddleware(app)
+    limiter.limit = 2
+    limited_client = TestClient(limiter)
+    headers = {"X-API-Key": "rate-limit-test"}
+
+    assert limited_client.get("/health", headers=headers).status_code == 200
+    assert limited_client.get("/health", headers=headers).status_code == 200
+    response = limited_client.get("/health", headers=headers)
+    assert response.status_code == 429
+    assert "Rate limit exceeded" in response.json()["detail"]
+
+
 def test_health_check():
     """Testa o endpoint de health check."""
     response = client.get("/health")
@@ -116,3 +170,25 @@ def test_planets_now():
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 10
+
+
+def test_import_with_redirected_stderr():
+    """Testa se o app importa e registra logs com um stderr sem descritor de arquivo."""
+    code = (
+        "import io, json, logging, sys\n"
+        "sys.stderr = io.StringIO()\n"
+        "import app.main\n"
+        "app.main.handler.handle(logging.makeLogRecord({'msg': 'ok', 'levelname': 'INFO'}))\n"
+        "captured = sys.stderr.getvalue()\n"
+        "sys.stderr = sys.__stderr__\n"
+        "print(json.loads(captured)['message'])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ok"
@@ -0,0 +1,52 @@
+"""
+Testes para o motor de numerologia pitagórica.
+"""
+from app.services.numerology import (
+    _strip_to_ascii_letters,
+    calculate_compatibility,
+    calculate_full_profile,
+    normalize_name,
+)
+
+
+def test_full_profile_mutation_does_not_leak():
+    """Testa se alterar um perfil devolvido não muda o resultado das chamadas seguintes."""
+    profile = calculate_full_profile("Ana Lu", 1, 1, 1990)
+    expected = profile["core_numbers"]["life_path"]["number"]
+
+    profile["core_numbers"]["life_path"]["number"] = 99
+    profile["life_cycles"]["pinnacles"]["pinnacles"].clear()
+
+    again = calculate_full_profile("Ana Lu", 1, 1, 1990)
+    assert again["core_numbers"]["life_path"]["number"] == expected
+    assert len(again["life_cycles"]["pinnacles"]["pinnacles"]) == 4
+
+    result = calculate_compatibility("Ana Lu", 1, 1, 1990, "Ana Lu", 1, 1, 1990)
+    assert result["person1"]["life_path"] == expected
+
+
+def _normalize_whole_name(name: str) -> str:
+    """Referência: normalização Unicode aplicada ao nome inteiro de uma vez."""
+    return " ".join(_strip_to_ascii_letters(name).split())
+
+
+def test_normalize_name_accents():
+    """Testa a remoção de acentos, pontuação e espaços extras via tabela de tradução."""
+    assert normalize_name("José Ñúñez-d'Ávila") == "JOSE NUNEZDAVILA"
+    assert normalize_name("  Conceição   Gonçalves ") == "CONCEICAO GONCALVES"
+    # Caractere a caractere equivale a normalizar o nome inteiro de uma vez
+    for name in ["José Ñúñez-d'Ávila", "Zoë Øre", "\u01c5emal"]:
+        assert normalize_name(name) == _normalize_whole_name(name)
+
+
+def test_normalize_name_decomposed_accent():
+    """Testa um acento combinante separado (NFD), que vai para a normalização completa."""
+    assert normalize_name("Jose\u0301") == "JOSE"
+    assert normalize_name("Jose\u0301") == normalize_name("José")
+
+
+def test_normalize_name_outside_table():
+    """Testa caracteres acima de U+024F, fora da tabela, que seguem o caminho lento."""
+    for name in ["\u1e40aria \u1e02", "\uff2d\uff41\uff52\uff49\uff41", "Jos\u00e9 \u1e40"]:
+        assert normalize_name(name) == _normalize_whole_name(name)
+    assert normalize_name("\u1e40aria") == "MARIA"
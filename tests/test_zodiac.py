@@ -0,0 +1,101 @@
+"""
+Testes para a conversão de longitudes em signos e casas.
+"""
+import random
+
+from app.services.zodiac import (
+    _rotated_cusps,
+    determine_house,
+    determine_houses,
+    longitude_to_sign,
+)
+
+# Casa 1 de 340° a 10°, cruzando 0° Áries; demais casas com 30°
+WRAP_CUSPS = (340.0, 10.0, 40.0, 70.0, 100.0, 130.0, 160.0, 190.0, 220.0, 250.0, 280.0, 310.0)
+# Casa 1 começa na menor cúspide; a casa 12 cruza 0° Áries
+ORDERED_CUSPS = tuple(15.0 + 30.0 * i for i in range(12))
+
+
+def test_longitude_to_sign_tiny_negative():
+    """Testa se negativos ínfimos, que viram 360.0 no `% 360`, caem em Áries 0°."""
+    assert longitude_to_sign(-1e-300) == ("Aries", 0.0)
+    assert longitude_to_sign(-1e-14) == ("Aries", 0.0)
+
+
+def test_longitude_to_sign_boundaries():
+    """Testa longitudes exatamente sobre a fronteira entre signos e logo antes dela."""
+    assert longitude_to_sign(0.0) == ("Aries", 0.0)
+    assert longitude_to_sign(30.0) == ("Taurus", 0.0)
+    assert longitude_to_sign(29.99) == ("Aries", 29.99)
+    assert longitude_to_sign(330.0) == ("Pisces", 0.0)
+    assert longitude_to_sign(360.0) == ("Aries", 0.0)
+    assert longitude_to_sign(-30.0) == ("Pisces", 0.0)
+
+
+def test_determine_house_wraps_past_aries():
+    """Testa a casa que cruza 0° Áries, dos dois lados do ponto zero."""
+    assert _rotated_cusps(WRAP_CUSPS) is not None
+    assert determine_house(355.0, WRAP_CUSPS) == 1
+    assert determine_house(5.0, WRAP_CUSPS) == 1
+    assert determine_house(10.5, WRAP_CUSPS) == 2
+
+
+def test_determine_house_on_cusp():
+    """Testa se uma longitude exatamente sobre a cúspide pertence à casa que começa nela."""
+    assert determine_house(40.0, WRAP_CUSPS) == 3
+    assert determine_house(340.0, WRAP_CUSPS) == 1
+    assert determine_house(15.0, ORDERED_CUSPS) == 1
+    assert determine_house(345.0, ORDERED_CUSPS) == 12
+
+
+def test_determine_house_below_smallest_cusp():
+    """Testa longitudes antes da menor cúspide, que caem na casa da última cúspide."""
+    assert determine_house(5.0, ORDERED_CUSPS) == 12
+    assert determine_house(0.0, ORDERED_CUSPS) == 12
+    assert determine_house(-1e-300, ORDERED_CUSPS) == 12
+
+
+def test_determine_houses_degenerate_cusps_use_linear_scan():
+    """Testa cúspides repetidas ou fora de ordem, que seguem pela varredura linear."""
+    repeated = (0.0, 30.0, 30.0, 90.0, 120.0, 150.0, 180.0, 210.0, 240.0, 270.0, 300.0, 330.0)
+    assert _rotated_cusps(repeated) is None
+    # A casa 2 vazia (30° a 30°) é tratada como cruzando 0° e captura o que a casa 1 não pega
+    assert determine_houses([15.0, 45.0, 100.0], repeated) == [1, 2, 2]
+
+    out_of_order = (0.0, 60.0, 30.0, 90.0, 120.0, 150.0, 180.0, 210.0, 240.0, 270.0, 300.0, 330.0)
+    assert _rotated_cusps(out_of_order) is None
+    assert determine_houses([45.0, 75.0, 20.0], out_of_order) == [1, 2, 1]
+
+
+def test_determine_houses_matches_single_point():
+    """Testa se a versão em lote concorda com a chamada ponto a ponto."""
+    longitudes = [0.0, 9.99, 10.0, 123.4, 339.99, 340.0, 359.99]
+    assert determine_houses(longitudes, WRAP_CUSPS) == [
+        determine_house(longitude, WRAP_CUSPS) for longitude in longitudes
+    ]
+
+
+def _linear_house(longitude: float, cusps: tuple[float, ...]) -> int:
+    """Referência: varredura linear original das 12 casas."""
+    longitude = longitude % 360
+    for i in range(12):
+        start, end = cusps[i] % 360, cusps[(i + 1) % 12] % 360
+        if start < end:
+            if start <= longitude < end:
+                return i + 1
+        elif longitude >= start or longitude < end:
+            return i + 1
+    return 1
+
+
+def test_determine_houses_bisect_matches_linear_scan():
+    """Testa a busca binária contra a varredura linear em cúspides aleatórias."""
+    rng = random.Random(1990)
+    for _ in range(2000):
+        ordered = sorted(rng.uniform(0, 360) for _ in range(12))
+        k = rng.randrange(12)
+        cusps = tuple(ordered[k:] + ordered[:k])
+        longitudes = [rng.uniform(-10, 370) for _ in range(5)] + list(cusps)
+        assert determine_houses(longitudes, cusps) == [
+            _linear_house(longitude, cusps) for longitude in longitudes
+        ]